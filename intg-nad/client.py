@@ -1,11 +1,108 @@
 """NAD Receiver Telnet Client."""
 import asyncio
 import logging
-import telnetlib
-from typing import Optional, Callable
+import random
+import socket
+from collections import deque
+from typing import Any, Optional, Callable
 
 _LOG = logging.getLogger(__name__)
 
+# Pre-encoded fixed commands and the response prefix they are answered with
+CMD_POWER_Q = b"Main.Power?\r\n"
+CMD_POWER_ON = b"Main.Power=On\r\n"
+CMD_POWER_OFF = b"Main.Power=Off\r\n"
+CMD_VOLUME_Q = b"Main.Volume?\r\n"
+CMD_VOLUME_UP = b"Main.Volume+\r\n"
+CMD_VOLUME_DOWN = b"Main.Volume-\r\n"
+CMD_MUTE_Q = b"Main.Mute?\r\n"
+CMD_MUTE_ON = b"Main.Mute=On\r\n"
+CMD_MUTE_OFF = b"Main.Mute=Off\r\n"
+CMD_SOURCE_Q = b"Main.Source?\r\n"
+CMD_MODEL_Q = b"Main.Model?\r\n"
+CMD_VERSION_Q = b"Main.Version?\r\n"
+
+PREFIX_POWER = b"Main.Power="
+PREFIX_VOLUME = b"Main.Volume="
+PREFIX_MUTE = b"Main.Mute="
+PREFIX_SOURCE = b"Main.Source="
+PREFIX_MODEL = b"Main.Model="
+PREFIX_VERSION = b"Main.Version="
+
+# Power monitoring reconnect backoff (seconds)
+RECONNECT_BASE_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30
+# A connection that stays up this long resets the reconnect backoff (seconds)
+RECONNECT_STABLE_TIME = 10
+
+# TCP keepalive: first probe after 30s idle, then every 10s, give up after 3;
+# unacknowledged writes time out after 20s (milliseconds)
+TCP_KEEPIDLE = 30
+TCP_KEEPINTVL = 10
+TCP_KEEPCNT = 3
+TCP_USER_TIMEOUT = 20000
+
+# Maximum number of queued commands written before a single drain()
+TX_BATCH_SIZE = 8
+
+# Probe the connection when nothing was received for this many seconds
+KEEPALIVE_INTERVAL = 60
+
+# Volume range: -92dB (min) to 0dB (max), mapped onto 0...100
+VOLUME_MIN_DB = -92
+VOLUME_MAX_DB = 0
+_DB_TO_PCT = tuple(
+    round((db - VOLUME_MIN_DB) * 100 / (VOLUME_MAX_DB - VOLUME_MIN_DB))
+    for db in range(VOLUME_MIN_DB, VOLUME_MAX_DB + 1)
+)
+_PCT_TO_DB = tuple(
+    round(pct * (VOLUME_MAX_DB - VOLUME_MIN_DB) / 100) + VOLUME_MIN_DB
+    for pct in range(0, 101)
+)
+
+
+def _parse_value(response: Optional[str]) -> Optional[str]:
+    """Return the value part of a 'Main.Key=Value' response, or None."""
+    if response:
+        _, sep, value = response.partition("=")
+        if sep:
+            return value.strip()
+    return None
+
+
+def _parse_on_off(response: Optional[str]) -> Optional[bool]:
+    """Parse an On/Off response into a bool, or None."""
+    value = _parse_value(response)
+    if value is None:
+        return None
+    return value.lower() == "on"
+
+
+def _parse_volume(response: Optional[str]) -> Optional[int]:
+    """Parse a -dB volume response into a 0-100 level, or None."""
+    value = _parse_value(response)
+    if value is None:
+        return None
+    try:
+        # NAD returns volume in -dB format, convert to 0-100
+        db = int(value.replace("dB", ""))
+        return _DB_TO_PCT[max(VOLUME_MIN_DB, min(VOLUME_MAX_DB, db)) - VOLUME_MIN_DB]
+    except ValueError:
+        _LOG.error(f"Invalid volume response: {response}")
+    return None
+
+
+def _parse_int(response: Optional[str]) -> Optional[int]:
+    """Parse an integer response (e.g. source number), or None."""
+    value = _parse_value(response)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        _LOG.error(f"Invalid integer response: {response}")
+    return None
+
 
 class NADClient:
     """
@@ -26,13 +123,32 @@ class NADClient:
         self.host = host
         self.port = port
         self.timeout = timeout
-        self._tn: Optional[telnetlib.Telnet] = None
-        self._lock = asyncio.Lock()
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._conn_lock = asyncio.Lock()  # Serializes connect() and close()
+        self._last_rx = 0.0  # Loop time of the last received line
+        self._tx_queue: asyncio.Queue[tuple[bytes, bytes, asyncio.Future]] = asyncio.Queue()
+        self._pending: dict[bytes, deque[asyncio.Future]] = {}  # Outstanding commands by response prefix, in send order
         self._monitoring = False
         self._monitor_task: Optional[asyncio.Task] = None
         self._power_callback: Optional[Callable[[bool], None]] = None
+        self._power_dispatch: Optional[Callable[[bool], None]] = None  # Sync entry point for the callback
+        self._callback_tasks: set[asyncio.Task] = set()
         self._last_power_state: Optional[bool] = None  # Track last known power state
-        self._pause_monitoring = False  # Flag to pause monitoring during commands
+        self._last_mute_state: Optional[bool] = None  # Track last known mute state
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the telnet connection is currently open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    @property
+    def power_state(self) -> Optional[bool]:
+        """Last known power state (True = on), or None if unknown."""
+        return self._last_power_state
 
     async def connect(self) -> bool:
         """
@@ -41,29 +157,241 @@ class NADClient:
         Returns:
             True if connected successfully
         """
+        async with self._conn_lock:
+            return await self._connect_locked()
+
+    async def _reconnect(self) -> bool:
+        """
+        Connect unless another caller already reconnected meanwhile.
+
+        Returns:
+            True if a connection is open afterwards
+        """
+        async with self._conn_lock:
+            if self._writer is not None:
+                return True
+            return await self._connect_locked()
+
+    async def _connect_locked(self) -> bool:
+        """Open the telnet connection, replacing any previous one. Caller holds _conn_lock."""
+        # Drop any previous connection so only one reader owns the socket
+        if self._writer:
+            await self._close_locked()
+
         try:
-            loop = asyncio.get_event_loop()
-            self._tn = await loop.run_in_executor(
-                None,
-                lambda: telnetlib.Telnet(self.host, self.port, self.timeout)
+            self._loop = asyncio.get_running_loop()
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                self.timeout
             )
+
+            sock = self._writer.get_extra_info('socket')
+            if sock is not None:
+                self._configure_socket(sock)
+
+            self._last_rx = self._loop.time()
+            self._reader_task = asyncio.create_task(self._read_loop(self._reader))
+            self._writer_task = asyncio.create_task(self._write_loop(self._writer))
             _LOG.info(f"Connected to NAD receiver at {self.host}:{self.port}")
             return True
         except Exception as e:
             _LOG.error(f"Failed to connect to NAD receiver: {e}")
             return False
 
+    @staticmethod
+    def _configure_socket(sock: socket.socket) -> None:
+        """Tune the telnet socket for small commands and dead peer detection."""
+        # Commands are tiny, don't let Nagle hold them back
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        # Detect a power-cycled receiver in seconds instead of hours.
+        # The fine-grained options are Linux-only, skip them elsewhere.
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for name, value in (
+            ("TCP_KEEPIDLE", TCP_KEEPIDLE),
+            ("TCP_KEEPINTVL", TCP_KEEPINTVL),
+            ("TCP_KEEPCNT", TCP_KEEPCNT),
+            ("TCP_USER_TIMEOUT", TCP_USER_TIMEOUT),
+        ):
+            option = getattr(socket, name, None)
+            if option is not None:
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, option, value)
+                except OSError as e:
+                    _LOG.debug("Could not set %s: %s", name, e)
+
     async def close(self):
         """Close telnet connection."""
-        if self._tn:
+        async with self._conn_lock:
+            await self._close_locked()
+
+    async def _close_if_current(self, writer: Optional[asyncio.StreamWriter]) -> None:
+        """Close the connection unless it has been replaced since writer was seen."""
+        async with self._conn_lock:
+            if self._writer is writer:
+                await self._close_locked()
+
+    async def _close_locked(self):
+        """Close telnet connection. Caller holds _conn_lock."""
+        try:
+            for task in (self._reader_task, self._writer_task):
+                if task and not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+            self._reader_task = None
+            self._writer_task = None
+
+            if self._writer:
+                try:
+                    self._writer.close()
+                    await self._writer.wait_closed()
+                    _LOG.info("NAD telnet connection closed")
+                except Exception as e:
+                    _LOG.error(f"Error closing connection: {e}")
+                finally:
+                    self._reader = None
+                    self._writer = None
+        finally:
+            # Also when cancelled midway (e.g. a time-bounded fast disconnect),
+            # so waiters don't hang until their own timeout
+            self._fail_pending(ConnectionError("Connection to NAD receiver closed"))
+            # Changes are missed while disconnected, so stop trusting the cache
+            self._last_power_state = None
+            self._last_mute_state = None
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        """
+        Background task that owns the socket's read side.
+
+        Every line is routed either to the command waiting for that response
+        prefix or, for unsolicited Main.Power updates, to the power callback.
+        """
+        try:
+            while True:
+                response = await reader.readuntil(b"\n")
+                self._last_rx = self._loop.time()
+                line = response.strip()
+                if not line:
+                    continue
+
+                key, sep, value = line.partition(b"=")
+                if not sep:
+                    _LOG.debug("Ignoring unexpected telnet data: %r", response)
+                    continue
+
+                # Only decode lines somebody is interested in; the frequent
+                # unsolicited updates (temperature etc.) stay raw bytes
+                future = self._pop_waiter(key + sep)
+                if future is not None:
+                    future.set_result(line.decode('ascii', 'replace'))
+                elif key == b"Main.Power":
+                    self._handle_power_update(value.strip().lower() == b"on")
+                elif key == b"Main.Mute":
+                    self._last_mute_state = value.strip().lower() == b"on"
+                # Silently ignore all other unsolicited messages (temperature, source, etc.)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            _LOG.warning(f"Connection to NAD receiver lost: {e}")
+            # A reader of a replaced connection must not touch the current one
+            if self._reader is reader:
+                self._fail_pending(ConnectionError("Connection to NAD receiver lost"))
+                if self._writer_task:
+                    self._writer_task.cancel()
+                    self._writer_task = None
+                self._writer.close()
+                self._reader = None
+                self._writer = None
+
+    async def _write_loop(self, writer: asyncio.StreamWriter) -> None:
+        """
+        Background task that owns the socket's write side.
+
+        Takes commands from the transmit queue and writes up to TX_BATCH_SIZE
+        of them back-to-back before a single drain(), so commands issued in
+        quick succession are pipelined instead of waiting for each other.
+        """
+        while True:
+            batch = [await self._tx_queue.get()]
+            while len(batch) < TX_BATCH_SIZE and not self._tx_queue.empty():
+                batch.append(self._tx_queue.get_nowait())
+
             try:
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, self._tn.close)
-                _LOG.info("NAD telnet connection closed")
+                for cmd_bytes, expected_prefix, future in batch:
+                    # Caller already gave up (timeout), don't bother sending
+                    if future.done():
+                        continue
+                    # Register before writing so the response can't arrive first
+                    self._pending.setdefault(expected_prefix, deque()).append(future)
+                    writer.write(cmd_bytes)
+                await writer.drain()
             except Exception as e:
-                _LOG.error(f"Error closing connection: {e}")
-            finally:
-                self._tn = None
+                _LOG.warning(f"Error writing to NAD receiver: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _pop_waiter(self, prefix: bytes) -> Optional[asyncio.Future]:
+        """Return the oldest command still waiting for a response with this prefix."""
+        waiters = self._pending.get(prefix)
+        while waiters:
+            future = waiters.popleft()
+            if not future.done():
+                return future
+        return None
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Fail all commands still waiting for a response or to be sent."""
+        for waiters in self._pending.values():
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(exc)
+        self._pending.clear()
+
+        while not self._tx_queue.empty():
+            _, _, future = self._tx_queue.get_nowait()
+            if not future.done():
+                future.set_exception(exc)
+
+    def _handle_power_update(self, power_on: bool) -> None:
+        """Process an unsolicited power state update from the receiver."""
+        # Only process if state actually changed
+        if self._last_power_state == power_on:
+            _LOG.debug("Power state unchanged (%s), ignoring", "ON" if power_on else "OFF")
+            return
+
+        self._last_power_state = power_on
+        if not self._monitoring or not self._power_dispatch:
+            return
+
+        _LOG.info(f"Power state changed: {'ON' if power_on else 'OFF'}")
+        self._power_dispatch(power_on)
+
+    def _run_power_callback(self, power_on: bool) -> None:
+        """Run an async power callback as a task."""
+        task = asyncio.create_task(self._power_callback(power_on))
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_tasks.discard)
+
+    @staticmethod
+    def _expected_prefix(command: str) -> bytes:
+        """
+        Determine the response prefix for a command.
+
+        For query commands (Main.Power?), set commands (Main.Power=On) and
+        step commands (Main.Volume+) the NAD answers with Main.Power=/Main.Volume=.
+        """
+        if "?" in command:
+            key = command.split("?")[0]
+        elif "=" in command:
+            key = command.split("=")[0]
+        else:
+            key = command.rstrip("+-")
+        return f"{key}=".encode('ascii')
 
     async def _send_command(self, command: str) -> Optional[str]:
         """
@@ -75,76 +403,85 @@ class NADClient:
         Returns:
             Response string or None on error
         """
-        if not self._tn:
+        return await self._send_raw(f"{command}\r\n".encode('ascii'), self._expected_prefix(command))
+
+    async def _send_raw(self, cmd_bytes: bytes, expected_prefix: bytes) -> Optional[str]:
+        """
+        Send an already encoded command to NAD receiver.
+
+        Args:
+            cmd_bytes: Command including line terminator (e.g., CMD_POWER_Q)
+            expected_prefix: Response prefix to wait for (e.g., PREFIX_POWER)
+
+        Returns:
+            Response string or None on error
+        """
+        if not self._writer:
             _LOG.error("Not connected to NAD receiver")
             return None
 
-        # Pause monitoring to prevent race condition
-        self._pause_monitoring = True
+        future = self._loop.create_future()
+        _LOG.debug("Sending command: %r", cmd_bytes)
+        self._tx_queue.put_nowait((cmd_bytes, expected_prefix, future))
         try:
-            async with self._lock:
-                try:
-                    loop = asyncio.get_event_loop()
-
-                    # Send command with newline
-                    cmd_bytes = f"{command}\r\n".encode('ascii')
-                    _LOG.debug(f"Sending command: '{command}' (bytes={cmd_bytes!r})")
-                    await loop.run_in_executor(None, self._tn.write, cmd_bytes)
-
-                    # Determine expected response prefix based on command
-                    # For query commands (Main.Power?), expect response starting with Main.Power=
-                    # For set commands (Main.Power=On), expect response with Main.Power=
-                    if "?" in command:
-                        expected_prefix = command.replace("?", "=")
-                    elif "=" in command:
-                        expected_prefix = command.split("=")[0] + "="
-                    else:
-                        expected_prefix = None
-
-                    # Read responses until we get the expected one or timeout
-                    # NAD may send multiple status updates, we need the right one
-                    # Use shorter timeout per read (0.5s) but keep trying for total timeout
-                    start_time = asyncio.get_event_loop().time()
-                    read_timeout = 0.5
-                    skipped_count = 0
-
-                    while (asyncio.get_event_loop().time() - start_time) < self.timeout:
-                        try:
-                            response = await loop.run_in_executor(
-                                None,
-                                lambda: self._tn.read_until(b"\n", timeout=read_timeout)
-                            )
-                            result = response.decode('ascii').strip()
-                            _LOG.debug(f"Received telnet data: '{result}' (length={len(result)}, bytes={response!r})")
-
-                            # Skip empty lines
-                            if not result:
-                                _LOG.debug("Skipping empty line")
-                                continue
-
-                            # Check if this is the response we're looking for
-                            if expected_prefix is None or result.startswith(expected_prefix):
-                                if skipped_count > 0:
-                                    _LOG.debug(f"Skipped {skipped_count} status updates before receiving response")
-                                _LOG.debug(f"Command: {command} -> Response: {result}")
-                                return result
-                            else:
-                                skipped_count += 1
-                                _LOG.debug(f"Skipping unrelated status update: '{result}' (expected prefix: '{expected_prefix}')")
-                        except Exception as e:
-                            # Timeout or other error waiting for next line
-                            _LOG.debug(f"Read timeout or error (expected, continuing): {type(e).__name__}")
-                            continue
-
-                    _LOG.warning(f"Did not receive expected response for command '{command}' after {skipped_count} status updates (expected prefix: '{expected_prefix}')")
-                    return None
+            # The reader task resolves the future as soon as the matching line arrives
+            result = await asyncio.wait_for(future, self.timeout)
+            _LOG.debug("Command: %r -> Response: %s", cmd_bytes, result)
+            return result
 
-                except Exception as e:
-                    _LOG.error(f"Error sending command '{command}': {e}")
-                    return None
-        finally:
-            # Resume monitoring
-            self._pause_monitoring = False
+        except asyncio.TimeoutError:
+            _LOG.warning(f"Did not receive expected response for command {cmd_bytes!r} (expected prefix: {expected_prefix!r})")
+            return None
+        except Exception as e:
+            _LOG.error(f"Error sending command {cmd_bytes!r}: {e}")
+            return None
+
+    async def query_many(self, commands: list[str]) -> dict[str, str]:
+        """
+        Send several query commands in one write and collect their responses.
+
+        All queries are written back-to-back and the replies are matched by
+        their key prefix, so the whole batch costs a single round-trip instead
+        of one per command.
+
+        Args:
+            commands: NAD query commands (e.g., ["Main.Power?", "Main.Mute?"])
+
+        Returns:
+            Dict mapping each answered command to its response string.
+            Commands without a response before the timeout are omitted.
+        """
+        # Results are keyed by command, so send each command only once
+        commands = list(dict.fromkeys(commands))
+        if not commands:
+            return {}
+
+        if not self._writer:
+            _LOG.error("Not connected to NAD receiver")
+            return {}
+
+        # Queue all commands at once; the writer task sends them in one batch
+        _LOG.debug("Sending batch: %s", commands)
+        futures: dict[str, asyncio.Future] = {}
+        for command in commands:
+            future = self._loop.create_future()
+            self._tx_queue.put_nowait((f"{command}\r\n".encode('ascii'), self._expected_prefix(command), future))
+            futures[command] = future
+
+        await asyncio.wait(futures.values(), timeout=self.timeout)
+
+        results = {}
+        for command, future in futures.items():
+            if not future.done():
+                # Give up on it; the writer/reader tasks skip cancelled futures
+                future.cancel()
+            elif future.exception() is None:
+                results[command] = future.result()
+
+        missing = [command for command in commands if command not in results]
+        if missing:
+            _LOG.warning(f"No response for batched commands: {missing}")
+        return results
 
     async def get_power(self) -> Optional[bool]:
         """
@@ -153,30 +490,34 @@ class NADClient:
         Returns:
             True if on, False if off, None on error
         """
-        response = await self._send_command("Main.Power?")
-        if response and "=" in response:
-            value = response.split("=")[1].strip()
-            power_on = value.lower() == "on"
+        response = await self._send_raw(CMD_POWER_Q, PREFIX_POWER)
+        power_on = _parse_on_off(response)
+        if power_on is not None:
             # Update last known state to prevent false "state changed" logs
             self._last_power_state = power_on
-            return power_on
-        return None
+        return power_on
 
     async def set_power(self, on: bool) -> bool:
         """
         Set power state.
 
+        Returns once the receiver has acknowledged the new state. When power
+        monitoring is active the state echoed by the receiver is also passed
+        to the monitoring callback.
+
         Args:
             on: True to turn on, False to turn off
 
         Returns:
             True if successful
         """
-        command = "Main.Power=On" if on else "Main.Power=Off"
-        response = await self._send_command(command)
+        response = await self._send_raw(CMD_POWER_ON if on else CMD_POWER_OFF, PREFIX_POWER)
         if response is not None:
-            # Update last known state
-            self._last_power_state = on
+            # The receiver echoes the new state, treat it like a status update;
+            # report what it sent back rather than what was requested
+            power_on = _parse_on_off(response)
+            if power_on is not None:
+                self._handle_power_update(power_on)
             return True
         return False
 
@@ -187,21 +528,8 @@ class NADClient:
         Returns:
             Volume level or None on error
         """
-        response = await self._send_command("Main.Volume?")
-        if response and "=" in response:
-            try:
-                # NAD returns volume in -dB format, convert to 0-100
-                # Typical range: -92dB (min) to 0dB (max)
-                value = response.split("=")[1].strip()
-                if value.startswith("-"):
-                    db = int(value.replace("dB", ""))
-                    # Convert -92dB...0dB to 0...100
-                    volume = max(0, min(100, int((db + 92) * 100 / 92)))
-                    return volume
-                return 0
-            except ValueError:
-                _LOG.error(f"Invalid volume response: {response}")
-        return None
+        response = await self._send_raw(CMD_VOLUME_Q, PREFIX_VOLUME)
+        return _parse_volume(response)
 
     async def set_volume(self, volume: int) -> bool:
         """
@@ -214,9 +542,7 @@ class NADClient:
             True if successful
         """
         # Convert 0-100 to -92dB...0dB
-        volume = max(0, min(100, volume))
-        db = int((volume * 92 / 100) - 92)
-        command = f"Main.Volume={db}"
+        command = f"Main.Volume={_PCT_TO_DB[max(0, min(100, volume))]}"
         response = await self._send_command(command)
         return response is not None
 
@@ -227,7 +553,7 @@ class NADClient:
         Returns:
             True if successful
         """
-        response = await self._send_command("Main.Volume+")
+        response = await self._send_raw(CMD_VOLUME_UP, PREFIX_VOLUME)
         return response is not None
 
     async def volume_down(self) -> bool:
@@ -237,7 +563,7 @@ class NADClient:
         Returns:
             True if successful
         """
-        response = await self._send_command("Main.Volume-")
+        response = await self._send_raw(CMD_VOLUME_DOWN, PREFIX_VOLUME)
         return response is not None
 
     async def get_mute(self) -> Optional[bool]:
@@ -247,11 +573,11 @@ class NADClient:
         Returns:
             True if muted, False if not muted, None on error
         """
-        response = await self._send_command("Main.Mute?")
-        if response and "=" in response:
-            value = response.split("=")[1].strip()
-            return value.lower() == "on"
-        return None
+        response = await self._send_raw(CMD_MUTE_Q, PREFIX_MUTE)
+        muted = _parse_on_off(response)
+        if muted is not None:
+            self._last_mute_state = muted
+        return muted
 
     async def set_mute(self, muted: bool) -> bool:
         """
@@ -263,18 +589,26 @@ class NADClient:
         Returns:
             True if successful
         """
-        command = "Main.Mute=On" if muted else "Main.Mute=Off"
-        response = await self._send_command(command)
-        return response is not None
+        response = await self._send_raw(CMD_MUTE_ON if muted else CMD_MUTE_OFF, PREFIX_MUTE)
+        if response is not None:
+            # Update last known state
+            self._last_mute_state = muted
+            return True
+        return False
 
     async def toggle_mute(self) -> bool:
         """
         Toggle mute state.
 
+        Uses the last known mute state and only queries the receiver
+        when it is not known yet.
+
         Returns:
             True if successful
         """
-        current = await self.get_mute()
+        current = self._last_mute_state
+        if current is None:
+            current = await self.get_mute()
         if current is not None:
             return await self.set_mute(not current)
         return False
@@ -286,14 +620,8 @@ class NADClient:
         Returns:
             Source number or None on error
         """
-        response = await self._send_command("Main.Source?")
-        if response and "=" in response:
-            try:
-                value = response.split("=")[1].strip()
-                return int(value)
-            except ValueError:
-                _LOG.error(f"Invalid source response: {response}")
-        return None
+        response = await self._send_raw(CMD_SOURCE_Q, PREFIX_SOURCE)
+        return _parse_int(response)
 
     async def set_source(self, source: int) -> bool:
         """
@@ -316,10 +644,8 @@ class NADClient:
         Returns:
             Model string or None on error
         """
-        response = await self._send_command("Main.Model?")
-        if response and "=" in response:
-            return response.split("=")[1].strip()
-        return None
+        response = await self._send_raw(CMD_MODEL_Q, PREFIX_MODEL)
+        return _parse_value(response)
 
     async def get_version(self) -> Optional[str]:
         """
@@ -328,10 +654,29 @@ class NADClient:
         Returns:
             Version string or None on error
         """
-        response = await self._send_command("Main.Version?")
-        if response and "=" in response:
-            return response.split("=")[1].strip()
-        return None
+        response = await self._send_raw(CMD_VERSION_Q, PREFIX_VERSION)
+        return _parse_value(response)
+
+    async def refresh_state(self) -> dict[str, Any]:
+        """
+        Fetch power, volume, mute and source in a single round-trip.
+
+        Returns:
+            Dict with "power", "volume", "mute" and "source" keys;
+            a value is None if the receiver did not answer that query
+        """
+        responses = await self.query_many(["Main.Power?", "Main.Volume?", "Main.Mute?", "Main.Source?"])
+        state = {
+            "power": _parse_on_off(responses.get("Main.Power?")),
+            "volume": _parse_volume(responses.get("Main.Volume?")),
+            "mute": _parse_on_off(responses.get("Main.Mute?")),
+            "source": _parse_int(responses.get("Main.Source?")),
+        }
+        if state["power"] is not None:
+            self._last_power_state = state["power"]
+        if state["mute"] is not None:
+            self._last_mute_state = state["mute"]
+        return state
 
     def start_power_monitoring(self, callback: Callable[[bool], None]) -> None:
         """
@@ -347,135 +692,107 @@ class NADClient:
 
         # Restart monitoring
         self._power_callback = callback
+        # Decide once how to invoke the callback instead of on every update
+        if asyncio.iscoroutinefunction(callback):
+            self._power_dispatch = self._run_power_callback
+        else:
+            self._power_dispatch = callback
         self._monitoring = True
         self._monitor_task = asyncio.create_task(self._monitor_power_loop())
         _LOG.info("Started power state monitoring")
 
-    async def stop_power_monitoring(self) -> None:
-        """Stop monitoring power state changes."""
+    def cancel_power_monitoring(self) -> None:
+        """Stop monitoring power state changes without waiting for the task to finish."""
         self._monitoring = False
 
         if self._monitor_task and not self._monitor_task.done():
             self._monitor_task.cancel()
-            try:
-                await self._monitor_task
-            except asyncio.CancelledError:
-                pass
 
         self._monitor_task = None
         self._power_callback = None
+        self._power_dispatch = None
         _LOG.info("Stopped power state monitoring")
 
+    async def stop_power_monitoring(self) -> None:
+        """Stop monitoring power state changes."""
+        task = self._monitor_task
+        self.cancel_power_monitoring()
+
+        if task and not task.done():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
     async def _monitor_power_loop(self) -> None:
         """
-        Background task to monitor unsolicited power state updates from NAD.
+        Background task that keeps the connection up while power is monitored.
 
         The NAD sends Main.Power=On/Off messages automatically when power state
-        changes (e.g., via physical button or remote).
+        changes (e.g., via physical button or remote); those are picked up by
+        the reader task. This loop waits for the connection to drop and probes
+        it with a keepalive query when the receiver has been silent for a while.
 
-        If connection is lost, attempts to reconnect every 10 seconds.
+        If connection is lost, reconnects with exponential backoff. The backoff
+        only resets once a connection stayed up for RECONNECT_STABLE_TIME, so a
+        receiver that accepts and immediately drops the session (e.g. another
+        telnet client is already connected) isn't hammered.
         """
         _LOG.info("Starting power monitoring loop")
-        consecutive_errors = 0
-        max_consecutive_errors = 5
-        reconnect_delay = 10  # seconds between reconnect attempts
+        attempt = 0
+        connected_at: Optional[float] = self._loop.time() if self._loop else None
 
         try:
             while self._monitoring:
                 # Check if connection is lost
-                if self._tn is None:
-                    _LOG.warning("Telnet connection lost, attempting to reconnect...")
-                    try:
-                        connected = await self.connect()
-                        if connected:
-                            _LOG.info("Reconnected to NAD receiver successfully")
-                            consecutive_errors = 0
-                        else:
-                            _LOG.warning(f"Reconnection failed, retrying in {reconnect_delay} seconds")
-                            await asyncio.sleep(reconnect_delay)
-                            continue
-                    except Exception as e:
-                        _LOG.error(f"Reconnection error: {e}")
-                        await asyncio.sleep(reconnect_delay)
-                        continue
+                if self._writer is None:
+                    if connected_at is not None:
+                        if self._loop.time() - connected_at >= RECONNECT_STABLE_TIME:
+                            attempt = 0
+                        connected_at = None
+
+                    if attempt:
+                        delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** (attempt - 1))
+                        delay += random.uniform(0, delay / 2)
+                        _LOG.warning(f"Reconnecting in {delay:.1f} seconds")
+                        await asyncio.sleep(delay)
+                        if not self._monitoring:
+                            break
 
-                # Skip reading if commands are being sent to prevent race condition
-                if self._pause_monitoring:
-                    await asyncio.sleep(0.1)
+                    _LOG.warning("Telnet connection lost, attempting to reconnect...")
+                    attempt += 1
+                    if await self._reconnect():
+                        _LOG.info("Reconnected to NAD receiver successfully")
+                        connected_at = self._loop.time()
+                    else:
+                        _LOG.warning("Reconnection failed")
                     continue
 
-                try:
-                    loop = asyncio.get_event_loop()
-
-                    # Use lock to prevent reading during command execution
-                    # Try to acquire lock with timeout to avoid blocking monitoring too long
-                    try:
-                        await asyncio.wait_for(self._lock.acquire(), timeout=0.1)
-                    except asyncio.TimeoutError:
-                        # Lock is held by command, skip this iteration
-                        await asyncio.sleep(0.1)
-                        continue
-
-                    try:
-                        # Read any incoming line with short timeout (non-blocking check)
-                        response = await loop.run_in_executor(
-                            None,
-                            lambda: self._tn.read_until(b"\n", timeout=1.0)
-                        )
-                    finally:
-                        self._lock.release()
-
-                    result = response.decode('ascii').strip()
-
-                    # Process received data (skip temperature and other unsolicited messages to reduce log noise)
-                    if result:
-                        # Check if it's a power state update
-                        if result.startswith("Main.Power="):
-                            _LOG.debug(f"Monitor received: '{result}' (length={len(result)}, bytes={response!r})")
-                            value = result.split("=")[1].strip()
-                            power_on = value.lower() == "on"
-
-                            # Only process if state actually changed
-                            if self._last_power_state != power_on:
-                                _LOG.info(f"Power state changed: {'ON' if power_on else 'OFF'}")
-                                self._last_power_state = power_on
-
-                                # Call the callback
-                                if self._power_callback:
-                                    if asyncio.iscoroutinefunction(self._power_callback):
-                                        await self._power_callback(power_on)
-                                    else:
-                                        self._power_callback(power_on)
-                            else:
-                                _LOG.debug(f"Power state unchanged ({('ON' if power_on else 'OFF')}), ignoring")
-
-                            consecutive_errors = 0
-                        # Silently ignore all other unsolicited messages (temperature, mute, source, etc.)
-
-                except asyncio.TimeoutError:
-                    # Normal - no data available, continue monitoring
-                    consecutive_errors = 0
+                # Wait until the reader task ends, i.e. the connection dropped or was closed
+                writer = self._writer
+                reader_task = self._reader_task
+                if reader_task is None or reader_task.done():
+                    # Reader is gone but the writer wasn't cleaned up, reconnect right away
+                    await self._close_if_current(writer)
                     continue
-                except asyncio.CancelledError:
-                    _LOG.info("Power monitoring task cancelled")
-                    raise
-                except Exception as e:
-                    consecutive_errors += 1
-                    _LOG.warning(f"Error in power monitoring loop: {e}")
-
-                    # Connection likely lost - close and mark for reconnect
-                    if consecutive_errors >= max_consecutive_errors:
-                        _LOG.error(f"Too many consecutive errors ({consecutive_errors}), closing connection for reconnect")
-                        try:
-                            if self._tn:
-                                self._tn.close()
-                        except:
-                            pass
-                        self._tn = None
-                        consecutive_errors = 0
-
-                    await asyncio.sleep(1)
-
+                await asyncio.wait({reader_task}, timeout=KEEPALIVE_INTERVAL)
+
+                # Receiver has been silent, make sure the connection still works
+                if (
+                    not reader_task.done()
+                    and self._loop.time() - self._last_rx >= KEEPALIVE_INTERVAL
+                ):
+                    _LOG.debug("No data received recently, sending keepalive")
+                    if await self._send_raw(CMD_MODEL_Q, PREFIX_MODEL) is None:
+                        _LOG.warning("Keepalive failed, closing connection for reconnect")
+                        await self._close_if_current(writer)
+
+        except asyncio.CancelledError:
+            _LOG.info("Power monitoring task cancelled")
+            raise
         finally:
-            self._monitoring = False
+            # A fast disconnect doesn't wait for this task, don't clear the
+            # flag of a monitoring session started after it
+            if self._monitor_task is asyncio.current_task():
+                self._monitoring = False
             _LOG.info("Power monitoring loop stopped")
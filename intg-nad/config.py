@@ -1,14 +1,20 @@
 """Configuration management for NAD devices."""
+import asyncio
+import atexit
 import json
 import logging
 import os
-from dataclasses import dataclass, asdict
+import threading
+from dataclasses import dataclass
 from typing import Optional
 
 _LOG = logging.getLogger(__name__)
 
+# Delay before writing changes, so bursts of add/remove calls share one write
+SAVE_DELAY = 0.5
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class NADdevice:
     """NAD device configuration."""
     device_id: str
@@ -25,15 +31,26 @@ class Config:
         """
         Initialize configuration manager.
 
+        Call load() afterwards to read the stored devices.
+
         Args:
             config_dir: Directory to store configuration
         """
         self.config_dir = config_dir
         self.config_file = os.path.join(config_dir, "devices.json")
         self._devices: dict[str, NADdevice] = {}
-        self._load()
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._dirty = False  # Unsaved changes pending
+        self._write_lock = threading.Lock()
+
+        # Don't lose a pending debounced save when the driver exits
+        atexit.register(self.flush)
+
+    async def load(self):
+        """Load configuration from file without blocking the event loop."""
+        await asyncio.get_running_loop().run_in_executor(None, self._load_sync)
 
-    def _load(self):
+    def _load_sync(self):
         """Load configuration from file."""
         if not os.path.exists(self.config_file):
             _LOG.info("No configuration file found, starting fresh")
@@ -51,34 +68,87 @@ class Config:
         except Exception as e:
             _LOG.error(f"Error loading configuration: {e}", exc_info=True)
 
+    def _serialize(self) -> dict:
+        """Build the JSON document for the current devices."""
+        return {
+            'devices': [
+                {
+                    'device_id': device.device_id,
+                    'name': device.name,
+                    'address': device.address,
+                    'port': device.port,
+                    'enabled': device.enabled,
+                    'monitor_power': device.monitor_power,
+                }
+                for device in self._devices.values()
+            ]
+        }
+
+    def _write_json_atomic(self, data: dict):
+        """Write configuration data to file (blocking, safe to run in a thread)."""
+        with self._write_lock:
+            try:
+                # Ensure config directory exists
+                os.makedirs(self.config_dir, exist_ok=True)
+
+                # Write to a temporary file and swap it in, so an interrupted
+                # write never leaves a truncated devices.json behind
+                tmp_file = self.config_file + ".tmp"
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_file, self.config_file)
+
+                _LOG.info(f"Saved {len(data['devices'])} devices to configuration")
+            except Exception as e:
+                _LOG.error(f"Error saving configuration: {e}", exc_info=True)
+
     def _save(self):
         """Save configuration to file."""
+        self._dirty = False
+        self._write_json_atomic(self._serialize())
+
+    def _schedule_save(self):
+        """Save configuration after a short delay, coalescing repeated changes."""
+        self._dirty = True
         try:
-            # Ensure config directory exists
-            os.makedirs(self.config_dir, exist_ok=True)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop (e.g. called during startup), save right away
+            self._save()
+            return
 
-            data = {
-                'devices': [asdict(device) for device in self._devices.values()]
-            }
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(SAVE_DELAY, self._flush_if_dirty, loop)
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+    def _flush_if_dirty(self, loop: asyncio.AbstractEventLoop):
+        """Write pending configuration changes without blocking the event loop."""
+        self._save_handle = None
+        if not self._dirty:
+            return
 
-            _LOG.info(f"Saved {len(self._devices)} devices to configuration")
-        except Exception as e:
-            _LOG.error(f"Error saving configuration: {e}", exc_info=True)
+        # Snapshot on the loop thread, write in the executor
+        self._dirty = False
+        loop.run_in_executor(None, self._write_json_atomic, self._serialize())
+
+    def flush(self):
+        """Write pending configuration changes immediately."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        if self._dirty:
+            self._save()
 
     def add_device(self, device: NADdevice) -> None:
         """Add or update a device."""
         self._devices[device.device_id] = device
-        self._save()
+        self._schedule_save()
         _LOG.info(f"Added device: {device.device_id} ({device.name})")
 
     def remove_device(self, device_id: str) -> bool:
         """Remove a device."""
         if device_id in self._devices:
             del self._devices[device_id]
-            self._save()
+            self._schedule_save()
             _LOG.info(f"Removed device: {device_id}")
             return True
         return False
@@ -1,10 +1,9 @@
 """NAD receiver discovery via mDNS/Zeroconf."""
 import asyncio
 import logging
-import socket
 from typing import Callable, Optional
-from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
-from zeroconf.asyncio import AsyncZeroconf
+from zeroconf import IPVersion, ServiceListener, Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 
 _LOG = logging.getLogger(__name__)
 
@@ -12,30 +11,61 @@ _LOG = logging.getLogger(__name__)
 # Common mDNS service types for network devices
 NAD_SERVICE_TYPE = "_musc._tcp.local."
 
+# Timeout for resolving a discovered service (milliseconds)
+SERVICE_INFO_TIMEOUT = 3000
+
+# Service type suffix stripped from mDNS names to get the device name
+_NAME_SUFFIX = f".{NAD_SERVICE_TYPE}"
+
 class NADDeviceListener(ServiceListener):
     """mDNS-based NAD receiver discovery manager."""
 
-    def __init__(self, callback: Callable[[dict], None], loop: asyncio.AbstractEventLoop):
+    def __init__(self, callback: Callable[[dict], None], removed_callback: Optional[Callable[[dict], None]] = None):
         """
         Initialize listener.
 
+        The listener is driven by AsyncServiceBrowser, so all handlers run
+        on the event loop.
+
         Args:
             callback: Async function to call when device is discovered
-            loop: Event loop to schedule callbacks on
+            removed_callback: Async function to call when a discovered device disappears
         """
         self._callback = callback
-        self._loop = loop
-        self._discovered = set()
+        self._removed_callback = removed_callback
+        self._discovered: dict[str, dict] = {}  # device_key -> device_info
+        self._names: dict[str, str] = {}  # mDNS service name -> device_key
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def devices(self) -> list[dict]:
+        """Devices currently resolved and not removed."""
+        return list(self._discovered.values())
+
+    def _schedule(self, coro) -> None:
+        """Run a coroutine on the event loop, keeping a reference until done."""
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     def add_service(self, zc: Zeroconf, type_: str, name: str) -> None:
         """Handle service addition."""
         _LOG.info(f"NAD BluOS service discovered: {name}")
 
-        info = zc.get_service_info(type_, name)
-        if info:
-            # Extract IP address
-            if info.addresses:
-                host = socket.inet_ntoa(info.addresses[0])
+        # Already resolved this service, skip the mDNS query for a re-announce
+        if name in self._names:
+            return
+
+        self._schedule(self._async_add_service(zc, type_, name))
+
+    async def _async_add_service(self, zc: Zeroconf, type_: str, name: str) -> None:
+        """Resolve a discovered service and report it if it is new or changed."""
+        info = AsyncServiceInfo(type_, name)
+        if await info.async_request(zc, SERVICE_INFO_TIMEOUT):
+            # Extract IP address, preferring IPv4 but accepting IPv6
+            addresses = info.parsed_addresses(IPVersion.V4Only) or info.parsed_addresses()
+            if addresses:
+                host = addresses[0]
             else:
                 _LOG.warning(f"No address for service {name}")
                 return
@@ -44,17 +74,15 @@ class NADDeviceListener(ServiceListener):
             port = 23
 
             # Extract device info from properties
-            props = {}
-            if info.properties:
-                for key, value in info.properties.items():
-                    try:
-                        props[key.decode('utf-8')] = value.decode('utf-8')
-                    except:
-                        pass
+            props = {
+                key.decode('utf-8', 'replace'): value.decode('utf-8', 'replace')
+                for key, value in (info.properties or {}).items()
+                if value is not None
+            }
 
             # Get device name from mDNS name or properties
             # Remove the service type suffix from the name
-            device_name = name.replace(f".{NAD_SERVICE_TYPE}", "").replace(".", " ").strip()
+            device_name = name.removesuffix(_NAME_SUFFIX).replace(".", " ").strip()
             if not device_name:
                 device_name = "NAD"
 
@@ -68,11 +96,6 @@ class NADDeviceListener(ServiceListener):
             device_name = f"{device_name} Remote"
 
             device_key = f"{host}:{port}"
-            if device_key in self._discovered:
-                return
-
-            self._discovered.add(device_key)
-
             device_info = {
                 "id": device_key,
                 "name": device_name,
@@ -82,23 +105,42 @@ class NADDeviceListener(ServiceListener):
                 "properties": props
             }
 
+            # Skip re-announcements of a device we already reported unchanged
+            if self._discovered.get(device_key) == device_info:
+                return
+
+            # The service moved to a new address, drop the entry under the old one
+            previous_key = self._names.get(name)
+            if previous_key is not None and previous_key != device_key:
+                previous_info = self._discovered.pop(previous_key, None)
+                if previous_info and self._removed_callback:
+                    await self._removed_callback(previous_info)
+
+            self._discovered[device_key] = device_info
+            self._names[name] = device_key
+
             _LOG.info(f"Discovered NAD BluOS device: {device_name} at {host}:{port}")
-            _LOG.debug(f"Device properties: {props}")
+            _LOG.debug("Device properties: %s", props)
 
-            # Call callback from zeroconf thread using run_coroutine_threadsafe
             if self._callback:
-                asyncio.run_coroutine_threadsafe(
-                    self._callback(device_info),
-                    self._loop
-                )
+                await self._callback(device_info)
 
     def remove_service(self, zc: Zeroconf, type_: str, name: str) -> None:
         """Handle service removal."""
         _LOG.info(f"BluOS service removed: {name}")
 
+        device_key = self._names.pop(name, None)
+        if device_key is None:
+            return
+
+        device_info = self._discovered.pop(device_key, None)
+        if device_info and self._removed_callback:
+            self._schedule(self._removed_callback(device_info))
+
     def update_service(self, zc: Zeroconf, type_: str, name: str) -> None:
         """Handle service update."""
-        _LOG.debug(f"BluOS service updated: {name}")
+        _LOG.debug("BluOS service updated: %s", name)
+        self._schedule(self._async_add_service(zc, type_, name))
 
 
 class NADDeviceDiscovery:
@@ -108,15 +150,28 @@ class NADDeviceDiscovery:
         """Initialize discovery manager."""
         self._running = False
         self._azc: Optional[AsyncZeroconf] = None
-        self._browser: Optional[ServiceBrowser] = None
+        self._browser: Optional[AsyncServiceBrowser] = None
         self._listener: Optional[NADDeviceListener] = None
 
-    async def start(self, callback: Callable[[dict], None]) -> None:
+    @property
+    def is_running(self) -> bool:
+        """Whether the mDNS browser is active."""
+        return self._running
+
+    @property
+    def devices(self) -> list[dict]:
+        """Devices currently known to the running browser."""
+        if not self._listener:
+            return []
+        return self._listener.devices
+
+    async def start(self, callback: Callable[[dict], None], removed_callback: Optional[Callable[[dict], None]] = None) -> None:
         """
         Start BluOS device discovery via mDNS.
 
         Args:
             callback: Async function to call when devices are discovered
+            removed_callback: Async function to call when a discovered device disappears
         """
         if self._running:
             _LOG.warning("Discovery already running")
@@ -126,20 +181,17 @@ class NADDeviceDiscovery:
         self._running = True
 
         try:
-            # Get the current event loop
-            loop = asyncio.get_event_loop()
-
             # Create AsyncZeroconf instance
             self._azc = AsyncZeroconf()
 
-            # Create listener with event loop
-            self._listener = NADDeviceListener(callback, loop)
+            # Create listener
+            self._listener = NADDeviceListener(callback, removed_callback)
 
-            # Create browser
-            self._browser = ServiceBrowser(
+            # Create browser, its handlers run on the event loop
+            self._browser = AsyncServiceBrowser(
                 self._azc.zeroconf,
                 NAD_SERVICE_TYPE,
-                self._listener
+                listener=self._listener
             )
 
             _LOG.info("BluOS mDNS discovery started successfully")
@@ -158,7 +210,7 @@ class NADDeviceDiscovery:
 
         if self._browser:
             try:
-                self._browser.cancel()
+                await self._browser.async_cancel()
             except Exception as e:
                 _LOG.debug(f"Error canceling browser: {e}")
             self._browser = None
@@ -172,6 +224,3 @@ class NADDeviceDiscovery:
 
         self._listener = None
 
-
-# Import socket for inet_ntoa
-import socket
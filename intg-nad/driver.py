@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 """NAD Receiver Integration Driver for Unfolded Circle Remote 3."""
 import asyncio
+import functools
 import logging
 import os
+import signal
 import sys
 import json
 
 import ucapi
-from remote import NADRemote
+from remote import NADRemote, entity_id_for
 from config import Config, NADdevice
 from discovery import NADDeviceDiscovery
 
@@ -24,6 +26,108 @@ nad_devices: dict[str, NADRemote] = {}
 # Discovery cache - stores discovered devices
 discovered_devices: dict[str, dict] = {}
 
+# Initial setup form, constant so it is built once
+_DRIVER_SETUP_REQUEST = ucapi.RequestUserInput(
+    title="NAD Receiver Setup",
+    settings=[
+        {
+            "id": "info",
+            "label": {
+                "en": "Discover or connect to NAD receiver",
+                "nl": "Ontdek of verbind met NAD receiver"
+            },
+            "field": {
+                "label": {
+                    "value": {
+                        "en": "Leave blank for auto-discovery or enter details manually.",
+                        "nl": "Laat leeg voor automatische ontdekking of vul handmatig in."
+                    }
+                }
+            }
+        },
+        {
+            "id": "name",
+            "label": {
+                "en": "Device Name",
+                "nl": "Apparaat Naam"
+            },
+            "field": {
+                "text": {"value": ""}
+            }
+        },
+        {
+            "id": "address",
+            "label": {
+                "en": "IP Address or mDNS name",
+                "nl": "IP Adres of mDNS naam"
+            },
+            "field": {
+                "text": {"value": ""}
+            }
+        },
+        {
+            "id": "port",
+            "label": {
+                "en": "Port",
+                "nl": "Poort"
+            },
+            "field": {
+                "number": {"value": 23, "min": 1, "max": 65535}
+            }
+        },
+        # {
+        #     "id": "monitor_power",
+        #     "label": {
+        #         "en": "Monitor Power State",
+        #         "nl": "Monitor Aan/Uit Status"
+        #     },
+        #     "field": {
+        #         "checkbox": {"value": False}
+        #     }
+        # }
+    ]
+)
+
+# Label of the discovered device dropdown
+_DEVICE_CHOICE_LABEL = {"en": "Device", "nl": "Apparaat"}
+
+# Auto-discovery waits up to DISCOVERY_TIMEOUT seconds for the first device,
+# then DISCOVERY_GRACE_PERIOD seconds for others
+DISCOVERY_TIMEOUT = 5.0
+DISCOVERY_GRACE_PERIOD = 0.5
+
+# Limit simultaneous receiver connects when many devices start at once
+MAX_CONCURRENT_CONNECTS = 8
+_connect_semaphore = asyncio.Semaphore(MAX_CONCURRENT_CONNECTS)
+
+# Subscribes within this window of a completed status fetch reuse its result (seconds)
+SUBSCRIBE_DEBOUNCE = 0.25
+
+# Loop time of the last successful subscribe status fetch per entity
+_last_status_fetch: dict[str, float] = {}
+
+# driver.json next to the sources, or in the working directory for the
+# PyInstaller build where the sources are bundled elsewhere. Resolved once.
+_DRIVER_JSON_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "driver.json"))
+if not os.path.exists(_DRIVER_JSON_PATH):
+    _DRIVER_JSON_PATH = os.path.abspath("driver.json")
+
+@functools.lru_cache(maxsize=1)
+def _driver_version() -> str:
+    """
+    Read the driver version from driver.json (once).
+
+    Returns:
+        Version string or "unknown" if it can't be read
+    """
+    try:
+        with open(_DRIVER_JSON_PATH, 'r', encoding='utf-8') as f:
+            driver_info = json.load(f)
+            return driver_info.get("version", "unknown")
+    except Exception as e:
+        _LOG.warning(f"Could not load version from driver.json: {e}")
+        return "unknown"
+
 async def add_device(device_config: NADdevice) -> bool:
     """
     Add a NAD device.
@@ -36,40 +140,60 @@ async def add_device(device_config: NADdevice) -> bool:
     """
     global nad_devices
 
+    # Keep a live connection for the same receiver instead of opening another one
+    existing = nad_devices.get(device_config.device_id)
+    if existing and existing.port == device_config.port and existing.client.is_connected:
+        _LOG.info(f"NAD device {device_config.device_id} already present and connected")
+        return True
+
     _LOG.info(f"Adding NAD device: {device_config.device_id} ({device_config.name})")
-    _LOG.debug(f"  Address: {device_config.address}:{device_config.port}")
-    _LOG.debug(f"  Monitor power: {device_config.monitor_power}")
+    _LOG.debug("  Address: %s:%s", device_config.address, device_config.port)
+    _LOG.debug("  Monitor power: %s", device_config.monitor_power)
 
     device = NADRemote(
         host=device_config.address,
         port=device_config.port,
         name=device_config.name,
         api=api,
-        monitor_power=device_config.monitor_power
+        monitor_power=device_config.monitor_power,
+        entity_id=device_config.device_id
     )
-    _LOG.debug(f"  NADRemote instance created with entity_id: {device.entity_id}")
+    _LOG.debug("  NADRemote instance created with entity_id: %s", device.entity_id)
 
     # Connect to NAD device
-    _LOG.debug(f"  Attempting to connect to NAD receiver...")
-    connected = await device.connect()
+    _LOG.debug("  Attempting to connect to NAD receiver...")
+    async with _connect_semaphore:
+        connected = await device.connect()
 
     if not connected:
         _LOG.error(f"Could not connect to NAD device {device_config.device_id}")
         return False
 
-    _LOG.debug(f"  Connection successful!")
+    _LOG.debug("  Connection successful!")
+
+    # Only now that the new instance works, retire a disconnected one it replaces
+    replaced_configured = False
+    if existing:
+        _LOG.info(f"Replacing disconnected NAD device: {device_config.device_id}")
+        await existing.disconnect()
+        api.available_entities.remove(existing.entity_id)
+        replaced_configured = api.configured_entities.contains(existing.entity_id)
+        if replaced_configured:
+            api.configured_entities.remove(existing.entity_id)
 
     # Store device
     nad_devices[device_config.device_id] = device
-    _LOG.debug(f"  Stored in nad_devices dict")
+    _LOG.debug("  Stored in nad_devices dict")
 
     # Add entity to available_entities (user subscribes via UC Remote UI)
-    _LOG.debug(f"  Adding to api.available_entities...")
+    _LOG.debug("  Adding to api.available_entities...")
     api.available_entities.add(device)
+    if replaced_configured:
+        api.configured_entities.add(device)
 
     _LOG.info(f"NAD device added successfully: {device_config.device_id}")
-    _LOG.debug(f"  Entity ID: {device.entity_id}")
-    _LOG.debug(f"  Device name: {device_config.name}")
+    _LOG.debug("  Entity ID: %s", device.entity_id)
+    _LOG.debug("  Device name: %s", device_config.name)
     return True
 
 
@@ -101,13 +225,54 @@ async def remove_device(device_id: str) -> bool:
 
     # Remove from dictionary
     del nad_devices[device_id]
+    _last_status_fetch.pop(entity_id, None)
 
     _LOG.info(f"NAD device removed: {device_id}")
     return True
 
+async def _reconnect_after_standby(device_id: str, device: NADRemote) -> bool:
+    """
+    Reconnect a device after the Remote exits standby.
+
+    Args:
+        device_id: Device identifier
+        device: Device to reconnect
+
+    Returns:
+        True if reconnected successfully
+    """
+    _LOG.info(f"Reconnecting device {device_id} after standby")
+
+    # Always disconnect and reconnect to ensure clean state; monitoring is
+    # stopped by the disconnect and restarted by connect()
+    await device.disconnect(fast=True)
+
+    # Try up to 3 times with increasing delays
+    max_attempts = 3
+    for attempt in range(1, max_attempts + 1):
+        try:
+            _LOG.info(f"Attempt {attempt}/{max_attempts}: Connecting to {device_id}")
+            connected = await device.connect()
+            if connected:
+                _LOG.info(f"Device {device_id} reconnected and power state refreshed")
+                return True
+            else:
+                _LOG.warning(f"Connection attempt {attempt} failed for {device_id}")
+        except Exception as e:
+            _LOG.warning(f"Reconnection attempt {attempt} failed for {device_id}: {e}")
+
+        # Wait before retry (except on last attempt)
+        if attempt < max_attempts:
+            wait_time = attempt * 2  # 2, 4 seconds
+            _LOG.info(f"Waiting {wait_time} seconds before retry...")
+            await asyncio.sleep(wait_time)
+
+    _LOG.error(f"Failed to reconnect device {device_id} after {max_attempts} attempts")
+    return False
+
 async def main(loop: asyncio.AbstractEventLoop):
     """Start the integration driver."""
-    global api, config
+    global api, config, discovery
     logging.basicConfig(
         level=logging.DEBUG,
         format="%(asctime)s | %(levelname)-8s | %(name)-25s | %(message)s"
@@ -123,17 +288,7 @@ async def main(loop: asyncio.AbstractEventLoop):
     logging.getLogger("config").setLevel(logging.DEBUG)
     logging.getLogger("__main__").setLevel(logging.DEBUG)
 
-    # Load version from driver.json
-    driver_json_path = os.path.join(os.path.dirname(__file__), "..", "driver.json")
-    try:
-        with open(driver_json_path, 'r', encoding='utf-8') as f:
-            driver_info = json.load(f)
-            version = driver_info.get("version", "unknown")
-    except Exception as e:
-        _LOG.warning(f"Could not load version from driver.json: {e}")
-        version = "unknown"
-
-    _LOG.info(f"NAD Telnet Integration starting (v{version})")
+    _LOG.info(f"NAD Telnet Integration starting (v{_driver_version()})")
 
     # Use the provided event loop
     api = ucapi.IntegrationAPI(loop)
@@ -141,16 +296,42 @@ async def main(loop: asyncio.AbstractEventLoop):
     # Initialize configuration manager
     config_dir = os.environ.get("UC_CONFIG_HOME", os.path.expanduser("~/.config/uc-nad"))
     config = Config(config_dir)
+    await config.load()
     _LOG.info(f"Configuration loaded: {len(config.all_devices())} devices")
 
+    # Write pending configuration changes before the loop is stopped by a signal;
+    # atexit alone doesn't run when the process is terminated by SIGTERM
+    def on_shutdown_signal(sig: signal.Signals) -> None:
+        _LOG.info(f"Received {sig.name}, saving configuration and stopping")
+        config.flush()
+        loop.stop()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, on_shutdown_signal, sig)
+        except (NotImplementedError, RuntimeError):
+            # Signal handlers aren't supported on this platform/loop
+            pass
+
     # Initialize discovery
     discovery = NADDeviceDiscovery()
+    device_discovered = asyncio.Event()  # Set when discovery reports a device
 
     # Load previously configured devices BEFORE api.init()
     # This ensures entities are available immediately after driver starts
-    for device_config in config.enabled_devices():
+    # Devices connect concurrently, so startup takes as long as the slowest one
+    enabled_devices = config.enabled_devices()
+    for device_config in enabled_devices:
         _LOG.info(f"Loading device from config: {device_config.device_id}")
-        await add_device(device_config)
+    results = await asyncio.gather(
+        *(add_device(device_config) for device_config in enabled_devices),
+        return_exceptions=True
+    )
+    for device_config, result in zip(enabled_devices, results):
+        if isinstance(result, Exception):
+            _LOG.error(f"Error loading device {device_config.device_id}: {result}")
+        elif not result:
+            _LOG.warning(f"Device {device_config.device_id} could not be loaded")
 
     # Event handlers
     @api.listens_to(ucapi.Events.CONNECT)
@@ -212,53 +393,38 @@ async def main(loop: asyncio.AbstractEventLoop):
         _LOG.info("Waiting 3 seconds for network to stabilize...")
         await asyncio.sleep(3)
 
-        # Reconnect devices that have power monitoring enabled
-        for device_id, device in nad_devices.items():
-            if device._monitor_power:
-                _LOG.info(f"Reconnecting device {device_id} after standby")
-
-                # Stop monitoring to prevent race conditions, will restart after reconnect
-                if device.client._monitoring:
-                    _LOG.debug(f"Stopping power monitoring for clean reconnect")
-                    await device.client.stop_power_monitoring()
-
-                # Always disconnect and reconnect to ensure clean state
-                await device.disconnect()
-
-                # Try up to 3 times with increasing delays
-                max_attempts = 3
-                for attempt in range(1, max_attempts + 1):
-                    try:
-                        _LOG.info(f"Attempt {attempt}/{max_attempts}: Connecting to {device_id}")
-                        connected = await device.connect()
-                        if connected:
-                            _LOG.info(f"Device {device_id} reconnected and power state refreshed")
-                            break
-                        else:
-                            _LOG.warning(f"Connection attempt {attempt} failed for {device_id}")
-                    except Exception as e:
-                        _LOG.warning(f"Reconnection attempt {attempt} failed for {device_id}: {e}")
-
-                    # Wait before retry (except on last attempt)
-                    if attempt < max_attempts:
-                        wait_time = attempt * 2  # 2, 4 seconds
-                        _LOG.info(f"Waiting {wait_time} seconds before retry...")
-                        await asyncio.sleep(wait_time)
-                else:
-                    _LOG.error(f"Failed to reconnect device {device_id} after {max_attempts} attempts")
+        # Reconnect devices that have power monitoring enabled, all at once
+        devices = [(device_id, device) for device_id, device in nad_devices.items() if device._monitor_power]
+        results = await asyncio.gather(
+            *(_reconnect_after_standby(device_id, device) for device_id, device in devices),
+            return_exceptions=True
+        )
+        for (device_id, _), result in zip(devices, results):
+            if isinstance(result, Exception):
+                _LOG.error(f"Error reconnecting device {device_id} after standby: {result}")
 
     @api.listens_to(ucapi.Events.SUBSCRIBE_ENTITIES)
     async def on_subscribe_entities(entity_ids: list[str]) -> None:
         """Handle entity subscription - fetch status on-demand."""
         _LOG.info(f"Subscribe entities: {entity_ids}")
-        for entity_id in entity_ids:
-            if entity_id in nad_devices:
-                device = nad_devices[entity_id]
-                try:
-                    await device.update_status()
-                    _LOG.debug(f"Updated status for {entity_id} on subscribe")
-                except Exception as e:
-                    _LOG.warning(f"Failed to update status for {entity_id}: {e}")
+        # The Remote can repeat subscribes in quick succession on reconnect;
+        # skip entities whose status was just fetched and pushed
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        entity_ids = [
+            entity_id for entity_id in entity_ids
+            if entity_id in nad_devices and now - _last_status_fetch.get(entity_id, float("-inf")) > SUBSCRIBE_DEBOUNCE
+        ]
+        results = await asyncio.gather(
+            *(nad_devices[entity_id].update_status(force=True) for entity_id in entity_ids),
+            return_exceptions=True
+        )
+        for entity_id, result in zip(entity_ids, results):
+            if isinstance(result, Exception):
+                _LOG.warning(f"Failed to update status for {entity_id}: {result}")
+            elif result:
+                _last_status_fetch[entity_id] = loop.time()
+                _LOG.debug("Updated status for %s on subscribe", entity_id)
 
     @api.listens_to(ucapi.Events.UNSUBSCRIBE_ENTITIES)
     async def on_unsubscribe_entities(entity_ids: list[str]) -> None:
@@ -296,8 +462,12 @@ async def main(loop: asyncio.AbstractEventLoop):
         """
         _LOG.info(f"Configuring NAD receiver '{name}' at {host}:{port} (monitor_power={monitor_power})")
 
-        # Create device_id from IP address
-        device_id = f"nad_{host.replace('.', '_')}"
+        # Create device_id from IP address, keeping the id of an existing
+        # configuration for this host (older versions kept ':' in IPv6 ids)
+        device_id = next(
+            (d.device_id for d in config.all_devices() if d.address == host),
+            entity_id_for(host)
+        )
 
         # Check if already configured
         if device_id in nad_devices:
@@ -334,7 +504,7 @@ async def main(loop: asyncio.AbstractEventLoop):
         Step 2: User selected device from dropdown
         """
         _LOG.info("Processing user data response")
-        _LOG.debug(f"Input values: {msg.input_values}")
+        _LOG.debug("Input values: %s", msg.input_values)
 
         # Get monitor_power setting from input
         monitor_power = True  # msg.input_values.get("monitor_power", True)
@@ -373,23 +543,38 @@ async def main(loop: asyncio.AbstractEventLoop):
                 # Auto-discovery
                 _LOG.info("Starting auto-discovery")
                 discovered_devices.clear()
+                device_discovered.clear()
 
                 try:
-                    await discovery.start(on_device_discovered)
-                    _LOG.info("Waiting for device discovery (5 seconds)...")
-                    await asyncio.sleep(5)
-                    await discovery.stop()
+                    # Browser keeps running between setup runs, only start it once
+                    if not discovery.is_running:
+                        await discovery.start(on_device_discovered, on_device_removed)
+
+                    # Include devices found by an earlier run, they are not re-announced
+                    for device_info in discovery.devices:
+                        discovered_devices[device_info["id"]] = device_info
+
+                    # Wait for the first device instead of a fixed delay
+                    if not discovered_devices:
+                        _LOG.info(f"Waiting for device discovery (up to {DISCOVERY_TIMEOUT} seconds)...")
+                        try:
+                            await asyncio.wait_for(device_discovered.wait(), timeout=DISCOVERY_TIMEOUT)
+                            # Grace period for other receivers answering at the same time
+                            await asyncio.sleep(DISCOVERY_GRACE_PERIOD)
+                        except asyncio.TimeoutError:
+                            pass
                     _LOG.info(f"Discovery complete: found {len(discovered_devices)} device(s)")
                 except Exception as e:
                     _LOG.warning(f"Discovery failed: {e}")
 
                 # Build dropdown with discovered devices
-                dropdown_items = []
-                for device_id, device_info in discovered_devices.items():
-                    dropdown_items.append({
+                dropdown_items = [
+                    {
                         "id": device_id,
                         "label": {"en": f"{device_info.get('name', 'NAD')} ({device_info['host']})"}
-                    })
+                    }
+                    for device_id, device_info in discovered_devices.items()
+                ]
 
                 if not dropdown_items:
                     _LOG.warning("No devices discovered")
@@ -401,7 +586,7 @@ async def main(loop: asyncio.AbstractEventLoop):
                     settings=[
                         {
                             "id": "device_choice",
-                            "label": {"en": "Device", "nl": "Apparaat"},
+                            "label": _DEVICE_CHOICE_LABEL,
                             "field": {
                                 "dropdown": {
                                     "value": dropdown_items[0]["id"],
@@ -430,6 +615,13 @@ async def main(loop: asyncio.AbstractEventLoop):
         device_id = device_info["id"]
         _LOG.info(f"Discovered NAD device: {device_id} at {device_info['host']}")
         discovered_devices[device_id] = device_info
+        device_discovered.set()
+
+    async def on_device_removed(device_info: dict):
+        """Callback when a discovered device leaves the network."""
+        device_id = device_info["id"]
+        _LOG.info(f"NAD device no longer available: {device_id}")
+        discovered_devices.pop(device_id, None)
 
     async def handle_driver_setup(msg: ucapi.DriverSetupRequest) -> ucapi.SetupAction:
         """
@@ -449,75 +641,15 @@ async def main(loop: asyncio.AbstractEventLoop):
         await asyncio.sleep(1)
 
         # Ask user for IP or use auto-discovery
-        return ucapi.RequestUserInput(
-            title="NAD Receiver Setup",
-            settings=[
-                {
-                    "id": "info",
-                    "label": {
-                        "en": "Discover or connect to NAD receiver",
-                        "nl": "Ontdek of verbind met NAD receiver"
-                    },
-                    "field": {
-                        "label": {
-                            "value": {
-                                "en": "Leave blank for auto-discovery or enter details manually.",
-                                "nl": "Laat leeg voor automatische ontdekking of vul handmatig in."
-                            }
-                        }
-                    }
-                },
-                {
-                    "id": "name",
-                    "label": {
-                        "en": "Device Name",
-                        "nl": "Apparaat Naam"
-                    },
-                    "field": {
-                        "text": {"value": ""}
-                    }
-                },
-                {
-                    "id": "address",
-                    "label": {
-                        "en": "IP Address or mDNS name",
-                        "nl": "IP Adres of mDNS naam"
-                    },
-                    "field": {
-                        "text": {"value": ""}
-                    }
-                },
-                {
-                    "id": "port",
-                    "label": {
-                        "en": "Port",
-                        "nl": "Poort"
-                    },
-                    "field": {
-                        "number": {"value": 23, "min": 1, "max": 65535}
-                    }
-                },
-                # {
-                #     "id": "monitor_power",
-                #     "label": {
-                #         "en": "Monitor Power State",
-                #         "nl": "Monitor Aan/Uit Status"
-                #     },
-                #     "field": {
-                #         "checkbox": {"value": False}
-                #     }
-                # }
-            ]
-        )
+        return _DRIVER_SETUP_REQUEST
 
     # Start the integration API with setup handler
-    # Pass "driver.json" directly - ucapi library handles path resolution
-    # This matches the approach used by LG TV and other integrations
+    # Pass the driver.json path resolved at import time
     _LOG.info("Calling api.init() with setup handler...")
     _LOG.info(f"sys.frozen={getattr(sys, 'frozen', False)}, sys.executable={sys.executable if getattr(sys, 'frozen', False) else 'N/A'}")
-    _LOG.info(f"cwd={os.getcwd()}, __file__={__file__}")
+    _LOG.info(f"cwd={os.getcwd()}, __file__={__file__}, driver.json={_DRIVER_JSON_PATH}")
 
-    await api.init("driver.json", driver_setup_handler)
+    await api.init(_DRIVER_JSON_PATH, driver_setup_handler)
     _LOG.info("API.INIT completed - driver ready")
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """NAD Remote entity implementation."""
 import asyncio
+import functools
 import logging
 from typing import Any, Optional
 
@@ -15,11 +16,42 @@ from client import NADClient
 
 _LOG = logging.getLogger(__name__)
 
+# Attribute payload per state, built once and shared (ucapi only reads it)
+_STATE_ATTRIBUTES = {state: {Attributes.STATE: state} for state in States}
+
+# Time allowed for closing the connection on a fast disconnect (seconds)
+FAST_DISCONNECT_TIMEOUT = 0.5
+
+# Characters in a host that are replaced to form the entity id (IPv4 dots, IPv6 colons)
+_DOT_TO_UNDER = str.maketrans({".": "_", ":": "_"})
+
+
+@functools.lru_cache(maxsize=128)
+def entity_id_for(host: str) -> str:
+    """
+    Build the entity id for a receiver host.
+
+    Args:
+        host: NAD receiver IP address
+
+    Returns:
+        Entity id, e.g. "nad_192_168_1_10"
+    """
+    return "nad_" + host.translate(_DOT_TO_UNDER)
+
 
 class NADRemote(Remote):
     """NAD Receiver Remote entity."""
 
-    def __init__(self, host: str, port: int = 23, name: str = "NAD Receiver", api=None, monitor_power: bool = True):
+    def __init__(
+        self,
+        host: str,
+        port: int = 23,
+        name: str = "NAD Receiver",
+        api=None,
+        monitor_power: bool = True,
+        entity_id: Optional[str] = None,
+    ):
         """
         Initialize NAD remote.
 
@@ -29,17 +61,20 @@ class NADRemote(Remote):
             name: Device name (from setup)
             api: Integration API instance
             monitor_power: Enable continuous power state monitoring
+            entity_id: Entity id to use, defaults to entity_id_for(host). Pass the
+                stored device_id so ids saved by older versions keep matching
         """
         self.host = host
         self.port = port
         self._api = api
-        self.entity_id = f"nad_{host.replace('.', '_')}"
+        self.entity_id = entity_id or entity_id_for(host)
         self._monitor_power = monitor_power
 
         self.client = NADClient(host=host, port=port)
 
         # Current status
         self._state = States.OFF
+        self._last_pushed_state: Optional[States] = None  # State last sent to the Remote
 
         # Periodic polling task
         self._poll_task: Optional[asyncio.Task] = None
@@ -72,13 +107,21 @@ class NADRemote(Remote):
                 _LOG.error(f"Could not connect to NAD receiver at {self.host}")
                 return False
 
-            # Fetch initial status
-            await self.update_status()
-
-            # Get receiver info for logging (don't use for naming anymore)
-            model = await self.client.get_model()
-            version = await self.client.get_version()
-            _LOG.debug(f"Model response: {model}, Version response: {version}")
+            # Fetch initial status and receiver info (for logging, not naming) together;
+            # the client pipelines the queries and matches replies by prefix
+            _, model, version = await asyncio.gather(
+                self.update_status(),
+                self.client.get_model(),
+                self.client.get_version(),
+                return_exceptions=True
+            )
+            if isinstance(model, Exception):
+                _LOG.warning(f"Could not get model: {model}")
+                model = None
+            if isinstance(version, Exception):
+                _LOG.warning(f"Could not get firmware version: {version}")
+                version = None
+            _LOG.debug("Model response: %s, Version response: %s", model, version)
             _LOG.info(f"Connected to NAD receiver at {self.host} (model: {model}, firmware: {version})")
 
             # Start power monitoring if enabled
@@ -97,10 +140,27 @@ class NADRemote(Remote):
             _LOG.error(f"Error connecting: {e}", exc_info=True)
             return False
 
-    async def disconnect(self):
-        """Disconnect from device."""
+    async def disconnect(self, fast: bool = False):
+        """
+        Disconnect from device.
+
+        Args:
+            fast: Cancel background tasks without waiting for them and bound
+                the time spent closing the connection (used before reconnecting)
+        """
         _LOG.info(f"Disconnecting from NAD receiver at {self.host}")
 
+        if fast:
+            if self._poll_task:
+                self._poll_task.cancel()
+                self._poll_task = None
+            self.client.cancel_power_monitoring()
+            try:
+                await asyncio.wait_for(self.client.close(), timeout=FAST_DISCONNECT_TIMEOUT)
+            except asyncio.TimeoutError:
+                _LOG.warning(f"Timed out closing connection to {self.host}")
+            return
+
         # Stop periodic polling
         if self._poll_task and not self._poll_task.done():
             self._poll_task.cancel()
@@ -123,16 +183,21 @@ class NADRemote(Remote):
         Args:
             power_on: True if power is on, False if off
         """
+        new_state = States.ON if power_on else States.OFF
+        if new_state == self._state:
+            return
+
         _LOG.info(f"Power state changed externally: {'ON' if power_on else 'OFF'}")
-        self._state = States.ON if power_on else States.OFF
+        self._state = new_state
         await self.update_attributes()
 
-    async def update_status(self, log_errors: bool = True):
+    async def update_status(self, log_errors: bool = True, force: bool = False):
         """
         Update device status from receiver.
 
         Args:
             log_errors: If False, suppress error logging (useful for periodic polls when NAD is off)
+            force: Push the state to the Remote even if it didn't change
         """
         try:
             # Get power state
@@ -145,7 +210,7 @@ class NADRemote(Remote):
                 if old_state != self._state:
                     _LOG.info(f"Power state updated: {old_state} -> {self._state}")
 
-                await self.update_attributes()
+                await self.update_attributes(force=force)
                 return True
             else:
                 # NAD didn't respond (might be off or shutting down)
@@ -157,20 +222,28 @@ class NADRemote(Remote):
             if log_errors:
                 _LOG.error(f"Error updating status: {e}", exc_info=True)
             else:
-                _LOG.debug(f"Error updating status (NAD might be off): {e}")
+                _LOG.debug("Error updating status (NAD might be off): %s", e)
             return False
 
-    async def update_attributes(self):
-        """Update entity attributes."""
+    async def update_attributes(self, force: bool = False):
+        """
+        Update entity attributes.
+
+        Args:
+            force: Push even if the state equals the last pushed state
+        """
         if self._api:
-            attributes = {
-                Attributes.STATE: self._state,
-            }
+            # Skip the WebSocket message if the Remote already has this state
+            if not force and self._state == self._last_pushed_state:
+                return
 
-            self._api.configured_entities.update_attributes(
+            # Only remember the state once an entity actually took it, it isn't
+            # stored while the entity is not configured yet
+            if self._api.configured_entities.update_attributes(
                 self.entity_id,
-                attributes
-            )
+                _STATE_ATTRIBUTES[self._state]
+            ):
+                self._last_pushed_state = self._state
 
     async def _periodic_poll(self):
         """
@@ -192,6 +265,22 @@ class NADRemote(Remote):
         except Exception as e:
             _LOG.error(f"Unexpected error in periodic polling: {e}", exc_info=True)
 
+    async def _toggle_power(self) -> bool:
+        """
+        Toggle power based on the last known state.
+
+        Only queries the receiver when the state is not known yet.
+
+        Returns:
+            True if the receiver acknowledged the new state
+        """
+        power = self.client.power_state
+        if power is None:
+            power = await self.client.get_power()
+        if power is None:
+            return False
+        return await self.client.set_power(not power)
+
     async def _handle_command(self, entity_id: str, command: str, params: dict[str, Any] | None = None) -> StatusCodes:
         """
         Handle remote commands.
@@ -207,33 +296,35 @@ class NADRemote(Remote):
         _LOG.info(f"Command received: {command} with params: {params}")
 
         try:
+            acknowledged = False
+
             if command == Commands.ON:
-                await self.client.set_power(True)
+                acknowledged = await self.client.set_power(True)
 
             elif command == Commands.OFF:
-                await self.client.set_power(False)
+                acknowledged = await self.client.set_power(False)
 
             elif command == Commands.TOGGLE:
-                power = await self.client.get_power()
-                if power is not None:
-                    await self.client.set_power(not power)
+                acknowledged = await self._toggle_power()
 
             elif command == Commands.SEND_CMD:
                 # Handle simple commands
                 if params and "command" in params:
                     cmd = params["command"]
                     if cmd == "POWER_ON":
-                        await self.client.set_power(True)
+                        acknowledged = await self.client.set_power(True)
                     elif cmd == "POWER_OFF":
-                        await self.client.set_power(False)
+                        acknowledged = await self.client.set_power(False)
                     elif cmd == "POWER_TOGGLE":
-                        power = await self.client.get_power()
-                        if power is not None:
-                            await self.client.set_power(not power)
+                        acknowledged = await self._toggle_power()
 
-            # Update status after command (but don't fail if NAD is shutting down)
-            await asyncio.sleep(0.1)
-            success = await self.update_status(log_errors=False)
+            # set_power returns once the NAD acknowledged the new state, so no delay is needed.
+            # With power monitoring the acknowledged state already reached _on_power_change,
+            # otherwise read it back (but don't fail if NAD is shutting down)
+            if self._monitor_power and self.client._monitoring:
+                success = acknowledged
+            else:
+                success = await self.update_status(log_errors=False)
 
             # If update failed after power OFF, assume NAD is shutting down and set state to OFF
             if not success and command in [Commands.OFF, "POWER_OFF"]: